@@ -16,110 +16,429 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.colors import ListedColormap
 import numpy as np
-from typing import List, Dict, Any, Tuple
-from collections import deque
+from typing import Dict, Any, Tuple
+from array import array
 import time
-import random
+
+try:
+    from numba import njit, prange, get_num_threads
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional; the NumPy code paths are used without it
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+def find_positive_cells(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Boolean mask of the positive cells and their (row, col) coordinates as a (P, 2) array"""
+    # C order so mask.view(np.uint8) matches the uint8[:, ::1] kernel signatures
+    mask = np.ascontiguousarray(np.asarray(grid) > 0)
+    return mask, np.argwhere(mask)
+
+
+def _diamond_offsets(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row and column offsets of every cell within Manhattan distance n of the origin"""
+    ys, xs = np.mgrid[-n:n + 1, -n:n + 1]
+    keep = np.abs(ys) + np.abs(xs) <= n
+    return ys[keep].astype(np.int32), xs[keep].astype(np.int32)
+
+
+def _taxicab_distance(mask: np.ndarray) -> np.ndarray:
+    """Exact Manhattan distance from every cell to the nearest True cell of mask"""
+    rows, cols = mask.shape
+    dist = np.where(mask, 0, rows + cols).astype(np.int32)
+    
+    # L1 distance is separable: sweep down/up the rows, then right/left along the columns
+    for r in range(1, rows):
+        np.minimum(dist[r], dist[r - 1] + 1, out=dist[r])
+    for r in range(rows - 2, -1, -1):
+        np.minimum(dist[r], dist[r + 1] + 1, out=dist[r])
+    for c in range(1, cols):
+        np.minimum(dist[:, c], dist[:, c - 1] + 1, out=dist[:, c])
+    for c in range(cols - 2, -1, -1):
+        np.minimum(dist[:, c], dist[:, c + 1] + 1, out=dist[:, c])
+    return dist
+
+
+# The generic kernels below are declared with explicit signatures, so Numba compiles
+# them (or loads them from its on-disk cache) at import rather than on the first click
+@njit('uint8[:, ::1](uint8[:, ::1], int64)', cache=True, boundscheck=False)
+def _stamp_diamonds(mask, n):
+    """Mark every cell within Manhattan distance n of a positive cell (compiled enumeration)"""
+    rows, cols = mask.shape
+    visited = np.zeros((rows, cols), np.uint8)
+    
+    for pos_row in range(rows):
+        for pos_col in range(cols):
+            if mask[pos_row, pos_col] == 0:
+                continue
+            for row_offset in range(max(-n, -pos_row), min(n, rows - 1 - pos_row) + 1):
+                remaining_distance = n - abs(row_offset)
+                new_row = pos_row + row_offset
+                for new_col in range(max(0, pos_col - remaining_distance),
+                                     min(cols, pos_col + remaining_distance + 1)):
+                    visited[new_row, new_col] = 1
+    return visited
+
+
+@njit('int32[:, ::1](uint8[:, ::1])', cache=True, boundscheck=False)
+def _chamfer_distance(mask):
+    """Two-pass (Rosenfeld) city-block distance transform of a uint8 mask"""
+    rows, cols = mask.shape
+    dist = np.empty((rows, cols), np.int32)
+    far = rows + cols
+    
+    # Forward pass: nearest seed above or to the left
+    for r in range(rows):
+        for c in range(cols):
+            if mask[r, c]:
+                d = 0
+            else:
+                d = far
+                if r > 0 and dist[r - 1, c] + 1 < d:
+                    d = dist[r - 1, c] + 1
+                if c > 0 and dist[r, c - 1] + 1 < d:
+                    d = dist[r, c - 1] + 1
+            dist[r, c] = d
+    
+    # Backward pass: nearest seed below or to the right
+    for r in range(rows - 1, -1, -1):
+        for c in range(cols - 1, -1, -1):
+            d = dist[r, c]
+            if r < rows - 1 and dist[r + 1, c] + 1 < d:
+                d = dist[r + 1, c] + 1
+            if c < cols - 1 and dist[r, c + 1] + 1 < d:
+                d = dist[r, c + 1] + 1
+            dist[r, c] = d
+    return dist
+
+
+# Grids with at least this many cells use the multi-threaded distance transform
+PARALLEL_MIN_CELLS = 1 << 16
+
+
+@njit('int32[:, ::1](uint8[:, ::1])', cache=True, boundscheck=False, parallel=True)
+def _parallel_taxicab_distance(mask):
+    """
+    Multi-threaded city-block distance transform. L1 distance is separable, so each
+    row is transformed independently, then each block of columns; both passes split
+    cleanly across threads. Columns are processed in blocks of 64 so the inner loop
+    still walks contiguous memory.
+    """
+    rows, cols = mask.shape
+    dist = np.empty((rows, cols), np.int32)
+    far = rows + cols
+    
+    # Row pass: distance to the nearest seed in the same row
+    for r in prange(rows):
+        d = far
+        for c in range(cols):
+            if mask[r, c]:
+                d = 0
+            elif d < far:
+                d += 1
+            dist[r, c] = d
+        d = far
+        for c in range(cols - 1, -1, -1):
+            if mask[r, c]:
+                d = 0
+            elif d < far:
+                d += 1
+            if d < dist[r, c]:
+                dist[r, c] = d
+    
+    # Column pass: combine the row distances down and up each column
+    block = 64
+    for b in prange((cols + block - 1) // block):
+        first_col = b * block
+        last_col = min(cols, first_col + block)
+        for r in range(1, rows):
+            for c in range(first_col, last_col):
+                if dist[r - 1, c] + 1 < dist[r, c]:
+                    dist[r, c] = dist[r - 1, c] + 1
+        for r in range(rows - 2, -1, -1):
+            for c in range(first_col, last_col):
+                if dist[r + 1, c] + 1 < dist[r, c]:
+                    dist[r, c] = dist[r + 1, c] + 1
+    return dist
+
+
+@njit('uint8[:, ::1](uint8[:, ::1], int64)', cache=True, boundscheck=False)
+def _bfs_levels(mask, n):
+    """Level-synchronous multi-source BFS; returns the uint8 visited mask after n levels"""
+    rows, cols = mask.shape
+    flat_mask = mask.ravel()
+    visited = np.zeros(rows * cols, np.uint8)
+    frontier = np.empty(rows * cols, np.int32)
+    next_frontier = np.empty(rows * cols, np.int32)
+    
+    size = 0
+    for idx in range(rows * cols):
+        if flat_mask[idx]:
+            visited[idx] = 1
+            frontier[size] = idx
+            size += 1
+    
+    # Cells are addressed as idx = r * cols + c; the four neighbor checks are unrolled
+    visited_count = size
+    for _ in range(n):
+        next_size = 0
+        for i in range(size):
+            idx = frontier[i]
+            r = idx // cols
+            c = idx - r * cols
+            if r > 0 and visited[idx - cols] == 0:
+                visited[idx - cols] = 1
+                next_frontier[next_size] = idx - cols
+                next_size += 1
+            if r < rows - 1 and visited[idx + cols] == 0:
+                visited[idx + cols] = 1
+                next_frontier[next_size] = idx + cols
+                next_size += 1
+            if c > 0 and visited[idx - 1] == 0:
+                visited[idx - 1] = 1
+                next_frontier[next_size] = idx - 1
+                next_size += 1
+            if c < cols - 1 and visited[idx + 1] == 0:
+                visited[idx + 1] = 1
+                next_frontier[next_size] = idx + 1
+                next_size += 1
+        frontier, next_frontier = next_frontier, frontier
+        size = next_size
+        visited_count += size
+        # Stop once nothing new was reached or the whole grid is covered
+        if size == 0 or visited_count == rows * cols:
+            break
+    return visited.reshape(rows, cols)
+
+
+# Largest N whose NumPy diamond stencil is cached, and the most stencils kept at once
+# (keys are (n, grid width), so distinct widths would otherwise grow the cache without bound)
+MAX_CACHED_STENCIL_N = 16
+MAX_CACHED_STENCILS = 64
 
 
 class NeighborhoodCalculator:
     """Core algorithm for Manhattan distance neighborhood calculation"""
     
-    def calculate_manhattan_neighborhood(self, grid: List[List[int]], n: int) -> Dict[str, Any]:
-        """Calculate Manhattan distance neighborhood"""
-        start_time = time.time()
+    def __init__(self):
+        # Diamond stencils for N <= MAX_CACHED_STENCIL_N, keyed by (n, grid width)
+        self._stencil_cache = {}
+    
+    def _stencil(self, n: int, cols: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Diamond offsets for radius n as (linear, row, col) arrays on a grid cols wide"""
+        stencil = self._stencil_cache.get((n, cols))
+        if stencil is None:
+            row_offsets, col_offsets = _diamond_offsets(n)
+            stencil = (row_offsets.astype(np.intp) * cols + col_offsets, row_offsets, col_offsets)
+            if n <= MAX_CACHED_STENCIL_N:
+                if len(self._stencil_cache) >= MAX_CACHED_STENCILS:
+                    self._stencil_cache.clear()
+                self._stencil_cache[(n, cols)] = stencil
+        return stencil
+    
+    def calculate_manhattan_neighborhood(self, grid: np.ndarray, n: int) -> Dict[str, Any]:
+        """Calculate Manhattan distance neighborhood by stamping a diamond around each positive cell"""
+        start_time = time.perf_counter()
         
         # Find positive cells
-        positive_cells = []
-        for row in range(len(grid)):
-            for col in range(len(grid[0])):
-                if grid[row][col] > 0:
-                    positive_cells.append((row, col))
+        mask, positive_cells = find_positive_cells(grid)
+        grid_height, grid_width = mask.shape
         
-        if not positive_cells:
+        if n < 0 or not len(positive_cells):
             return {
                 'count': 0,
-                'neighborhood_cells': set(),
-                'positive_cells': [],
-                'computation_time': time.time() - start_time
+                'neighborhood_cells': positive_cells[:0],
+                'positive_cells': positive_cells,
+                'computation_time': time.perf_counter() - start_time
             }
         
-        # Calculate neighborhoods
-        all_neighborhoods = set()
-        grid_height = len(grid)
-        grid_width = len(grid[0])
-        
-        for pos_row, pos_col in positive_cells:
-            for distance in range(n + 1):
-                for row_offset in range(-distance, distance + 1):
-                    remaining_distance = distance - abs(row_offset)
-                    for col_offset in range(-remaining_distance, remaining_distance + 1):
-                        new_row = pos_row + row_offset
-                        new_col = pos_col + col_offset
-                        
-                        if 0 <= new_row < grid_height and 0 <= new_col < grid_width:
-                            all_neighborhoods.add((new_row, new_col))
+        if HAS_NUMBA:
+            neighborhood = _stamp_diamonds(mask.view(np.uint8), n).view(bool)
+        elif 2 * n * (n + 1) + 1 > grid_height * grid_width:
+            # The diamond is bigger than the grid; thresholding the distance transform is cheaper
+            neighborhood = _taxicab_distance(mask) <= n
+        else:
+            # Broadcast the diamond stencil over batches of positive cells (each batch bounded
+            # to about a million candidate cells)
+            linear_offsets, row_offsets, col_offsets = self._stencil(n, grid_width)
+            batch_size = max(1, (1 << 20) // len(linear_offsets))
+            neighborhood = np.zeros(grid_height * grid_width, dtype=bool)
+            
+            # Diamonds clear of the border need no bounds checks: scatter p + stencil directly
+            pos_rows, pos_cols = positive_cells[:, 0], positive_cells[:, 1]
+            interior = ((pos_rows >= n) & (pos_rows < grid_height - n) &
+                        (pos_cols >= n) & (pos_cols < grid_width - n))
+            centers = pos_rows[interior] * grid_width + pos_cols[interior]
+            for start in range(0, len(centers), batch_size):
+                batch = centers[start:start + batch_size]
+                neighborhood[(batch[:, None] + linear_offsets).ravel()] = True
+            
+            # Diamonds touching the border are clipped with row/column checks
+            border_cells = positive_cells[~interior]
+            for start in range(0, len(border_cells), batch_size):
+                batch = border_cells[start:start + batch_size]
+                new_rows = (batch[:, :1] + row_offsets).ravel()
+                new_cols = (batch[:, 1:] + col_offsets).ravel()
+                in_bounds = ((new_rows >= 0) & (new_rows < grid_height) &
+                             (new_cols >= 0) & (new_cols < grid_width))
+                neighborhood[new_rows[in_bounds] * grid_width + new_cols[in_bounds]] = True
+            neighborhood = neighborhood.reshape(grid_height, grid_width)
         
         return {
-            'count': len(all_neighborhoods),
-            'neighborhood_cells': all_neighborhoods,
+            'count': int(neighborhood.sum()),
+            'neighborhood_cells': np.argwhere(neighborhood),
             'positive_cells': positive_cells,
-            'computation_time': time.time() - start_time
+            'computation_time': time.perf_counter() - start_time
         }
 
-    def bfs_manhattan_neighborhood(self, grid: List[List[int]], n: int) -> Dict[str, Any]:
+    def bfs_manhattan_neighborhood(self, grid: np.ndarray, n: int) -> Dict[str, Any]:
         """
         BFS-based method to calculate Manhattan neighborhood of all positive cells.
 
         Returns:
             Dictionary containing:
                 - count: number of unique cells within distance
-                - neighborhood_cells: set of (row, col) positions in the neighborhood
-                - positive_cells: list of (row, col) of positive value cells
+                - neighborhood_cells: array of (row, col) positions in the neighborhood
+                - positive_cells: array of (row, col) of positive value cells
                 - computation_time: runtime in seconds
         """
-        start_time = time.time()
-
-        rows, cols = len(grid), len(grid[0])
-        visited = set()
-        queue = deque()
-        positive_cells = []
+        start_time = time.perf_counter()
 
-        # Seed the queue with all positive cells
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] > 0:
-                    visited.add((r, c))
-                    queue.append(((r, c), 0))
-                    positive_cells.append((r, c))
+        # Find positive cells
+        mask, positive_cells = find_positive_cells(grid)
+        rows, cols = mask.shape
 
-        if not positive_cells:
+        if n < 0 or not len(positive_cells):
             return {
                 'count': 0,
-                'neighborhood_cells': set(),
-                'positive_cells': [],
-                'computation_time': time.time() - start_time
+                'neighborhood_cells': positive_cells[:0],
+                'positive_cells': positive_cells,
+                'computation_time': time.perf_counter() - start_time
             }
 
-        # Perform BFS to find all reachable cells within distance n
-        while queue:
-            (r, c), dist = queue.popleft()
-            if dist == n:
-                continue
+        if HAS_NUMBA:
+            visited = _bfs_levels(mask.view(np.uint8), n)
+        else:
+            # Flat visited mask indexed by r * cols + c, seeded with every positive cell
+            seeds = np.flatnonzero(mask)
+            visited = np.zeros(rows * cols, dtype=np.uint8)
+            visited[seeds] = 1
+
+            # Preallocated queue: every cell is enqueued at most once, so rows * cols slots suffice.
+            # queue[head:tail] holds the current BFS level, so no per-entry distance is stored.
+            queue = array('i', [0]) * (rows * cols)
+            tail = len(seeds)
+            queue[:tail] = array('i', seeds.tolist())
+            head = 0
+            last_row, last_col = rows - 1, cols - 1
+
+            # Expand level by level; after n levels every cell within distance n is visited
+            for _ in range(n):
+                level_end = tail
+                while head < level_end:
+                    idx = queue[head]
+                    head += 1
+                    r, c = divmod(idx, cols)
+                    if r > 0 and not visited[idx - cols]:
+                        visited[idx - cols] = 1
+                        queue[tail] = idx - cols
+                        tail += 1
+                    if r < last_row and not visited[idx + cols]:
+                        visited[idx + cols] = 1
+                        queue[tail] = idx + cols
+                        tail += 1
+                    if c > 0 and not visited[idx - 1]:
+                        visited[idx - 1] = 1
+                        queue[tail] = idx - 1
+                        tail += 1
+                    if c < last_col and not visited[idx + 1]:
+                        visited[idx + 1] = 1
+                        queue[tail] = idx + 1
+                        tail += 1
+                # Every visited cell is enqueued exactly once, so tail counts them;
+                # stop once a level adds nothing or the whole grid is covered
+                if head == tail or tail == rows * cols:
+                    break
+            visited = visited.reshape(rows, cols)
+
+        return {
+            'count': int(visited.sum()),
+            'neighborhood_cells': np.argwhere(visited),
+            'positive_cells': positive_cells,
+            'computation_time': time.perf_counter() - start_time
+        }
+
+    def distance_transform_neighborhood(self, grid: np.ndarray, n: int) -> Dict[str, Any]:
+        """
+        Distance-transform method: compute the Manhattan distance of every cell to
+        its nearest positive cell in a few whole-row/column sweeps, then threshold.
 
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited:
-                    visited.add((nr, nc))
-                    queue.append(((nr, nc), dist + 1))
+        Returns:
+            Same dictionary layout as bfs_manhattan_neighborhood
+        """
+        start_time = time.perf_counter()
+
+        mask, positive_cells = find_positive_cells(grid)
+
+        if not len(positive_cells):
+            return {
+                'count': 0,
+                'neighborhood_cells': positive_cells,
+                'positive_cells': positive_cells,
+                'computation_time': time.perf_counter() - start_time
+            }
+
+        if HAS_NUMBA and mask.size >= PARALLEL_MIN_CELLS and get_num_threads() > 1:
+            reachable = _parallel_taxicab_distance(mask.view(np.uint8)) <= n
+        elif HAS_NUMBA:
+            reachable = _chamfer_distance(mask.view(np.uint8)) <= n
+        else:
+            reachable = _taxicab_distance(mask) <= n
 
         return {
-            'count': len(visited),
-            'neighborhood_cells': visited,
+            'count': int(np.count_nonzero(reachable)),
+            'neighborhood_cells': np.argwhere(reachable),
             'positive_cells': positive_cells,
-            'computation_time': time.time() - start_time
+            'computation_time': time.perf_counter() - start_time
+        }
+
+    def compute(self, grid: np.ndarray, n: int, algo: str = 'auto') -> Dict[str, Any]:
+        """
+        Calculate the neighborhood with the cheapest method for this input.
+
+        'auto' compares the diamond enumeration cost, P * (2N+1)^2 for P positive
+        cells, against the rows * cols cost of the distance transform. It picks
+        enumeration only when that is clearly cheaper. Pass 'enumeration', 'bfs'
+        or 'distance_transform' to force a method.
+
+        Returns:
+            Same dictionary layout as bfs_manhattan_neighborhood, plus
+                - algorithm: name of the method that ran
+        """
+        methods = {
+            'enumeration': self.calculate_manhattan_neighborhood,
+            'bfs': self.bfs_manhattan_neighborhood,
+            'distance_transform': self.distance_transform_neighborhood
         }
 
+        if algo == 'auto':
+            arr = np.asarray(grid)
+            enumeration_cost = int(np.count_nonzero(arr > 0)) * (2 * n + 1) ** 2
+            algo = 'enumeration' if enumeration_cost < arr.size / 4 else 'distance_transform'
+        elif algo not in methods:
+            raise ValueError(f"Unknown algorithm '{algo}', expected one of {', '.join(methods)}")
+
+        result = methods[algo](grid, n)
+        result['algorithm'] = algo
+        return result
+
 
 class NeighborhoodGUI:
     """GUI for Manhattan Distance Neighborhood Calculator"""
@@ -152,6 +471,9 @@ class NeighborhoodGUI:
         self.current_example = 0
         self.examples_data = []
         
+        # Results keyed by (grid id, N); color and grid-line changes reuse them
+        self._result_cache = {}
+        
         # Toggle grid state
         self.show_grid = tk.BooleanVar(value=False)
         
@@ -330,6 +652,28 @@ class NeighborhoodGUI:
         self.fig, self.ax = plt.subplots(figsize=(12, 8), facecolor=self.colors['card'])
         self.fig.patch.set_facecolor(self.colors['card'])
         self.ax.set_facecolor(self.colors['card'])
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+        
+        # Legend built once; display_current_example only recolors its patches
+        legend_elements = [
+            plt.Rectangle((0, 0), 1, 1, edgecolor='black', label='Empty'),
+            plt.Rectangle((0, 0), 1, 1, edgecolor='black', label='Neighborhood'),
+            plt.Rectangle((0, 0), 1, 1, edgecolor='white', label='Positive Cell')
+        ]
+        legend = self.ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.6, 1))
+        legend.get_frame().set_facecolor(self.colors['card'])
+        for text in legend.get_texts():
+            text.set_color(self.colors['text'])
+        self._legend_patches = legend.get_patches()
+        
+        # Plot artists and display buffer reused across redraws
+        self._display_buf = None
+        self._im = None
+        self._text_artists = []
+        self._text_grid_id = None
+        self._grid_lines = []
+        self._grid_lines_key = None
         
         self.canvas = FigureCanvasTkAgg(self.fig, viz_panel)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
@@ -342,31 +686,31 @@ class NeighborhoodGUI:
             {
                 'title': 'Basic Example',
                 'description': 'Two positive cells with overlapping neighborhoods',
-                'grid': [
+                'grid': np.array([
                     [0, 0, 0, 0, 0],
                     [0, 1, 0, 0, 0],
                     [0, 0, 0, 0, 0],
                     [0, 0, 0, 2, 0],
                     [0, 0, 0, 0, 0]
-                ],
+                ], dtype=np.int8),
                 'n': 2
             },
             {
                 'title': 'Edge Cases',
                 'description': 'Positive cells at boundaries',
-                'grid': [
+                'grid': np.array([
                     [1, 0, 0, 0, 2],
                     [0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0],
                     [3, 0, 0, 0, 4]
-                ],
+                ], dtype=np.int8),
                 'n': 3
             },
             {
                 'title': 'Complex Pattern',
                 'description': 'Multiple overlapping neighborhoods',
-                'grid': [
+                'grid': np.array([
                     [0, 0, 1, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0],
                     [2, 0, 0, 0, 0, 0, 3],
@@ -374,25 +718,25 @@ class NeighborhoodGUI:
                     [0, 0, 0, 4, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0]
-                ],
+                ], dtype=np.int8),
                 'n': 2
             },
             {
                 'title': 'Dense Grid',
                 'description': 'Many positive cells',
-                'grid': [
+                'grid': np.array([
                     [1, 0, 2, 0, 1],
                     [0, 0, 0, 0, 0],
                     [3, 0, 0, 0, 4],
                     [0, 0, 0, 0, 0],
                     [2, 0, 1, 0, 3]
-                ],
+                ], dtype=np.int8),
                 'n': 1
             },
             {
                 'title': 'Large Scale',
                 'description': 'Performance test with larger grid',
-                'grid': [
+                'grid': np.array([
                     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                     [0, 1, 0, 0, 0, 0, 0, 0, 2, 0],
                     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
@@ -403,7 +747,7 @@ class NeighborhoodGUI:
                     [0, 5, 0, 0, 0, 0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-                ],
+                ], dtype=np.int8),
                 'n': 4
             }
         ]
@@ -426,70 +770,83 @@ class NeighborhoodGUI:
         example = self.examples_data[self.current_example]
         current_n = int(self.n_var.get())
         
-        # Calculate result
-        result = self.calculator.bfs_manhattan_neighborhood(example['grid'], current_n)
-        # result = self.calculator.calculate_manhattan_neighborhood(example['grid'], current_n)
+        # Calculate result (only when the grid or N changed)
+        cache_key = (id(example['grid']), current_n)
+        result = self._result_cache.get(cache_key)
+        if result is None:
+            result = self.calculator.compute(example['grid'], current_n)
+            self._result_cache[cache_key] = result
         example['result'] = result
         example['n'] = current_n
         
-        # Clear plot
-        self.ax.clear()
-        
         # Get colors
         colors = self.get_color_scheme(self.color_scheme_var.get())
         
         # Create display grid
-        grid = np.array(example['grid'])
-        display_grid = np.zeros_like(grid, dtype=int)
+        grid = example['grid']
+        grid_height, grid_width = grid.shape
+        if self._display_buf is None or self._display_buf.shape != grid.shape:
+            self._display_buf = np.zeros(grid.shape, dtype=np.uint8)
+        display_grid = self._display_buf
+        display_grid.fill(0)
         
         # Mark neighborhoods and positive cells
-        for cell in result['neighborhood_cells']:
-            display_grid[cell[0], cell[1]] = 1
-        for cell in result['positive_cells']:
-            display_grid[cell[0], cell[1]] = 2
+        neighborhood_cells = result['neighborhood_cells']
+        positive_cells = result['positive_cells']
+        display_grid[neighborhood_cells[:, 0], neighborhood_cells[:, 1]] = 1
+        display_grid[positive_cells[:, 0], positive_cells[:, 1]] = 2
         
-        # Create visualization
+        # Update visualization, reusing the image artist when the grid shape is unchanged
         cmap = ListedColormap([colors['empty'], colors['neighborhood'], colors['positive']])
         bounds = [0, 1, 2, 3]
         norm = plt.matplotlib.colors.BoundaryNorm(bounds, cmap.N)
         
-        self.ax.imshow(display_grid, cmap=cmap, norm=norm, aspect='equal')
-        
-        # Add cell values
-        for i in range(len(grid)):
-            for j in range(len(grid[0])):
-                if grid[i, j] > 0:
-                    text_color = 'white' if colors['positive'] in ['#1a202c', '#000000', '#1e40af', '#166534'] else 'black'
+        if self._im is None or self._im.get_array().shape != display_grid.shape:
+            if self._im is not None:
+                self._im.remove()
+            self._im = self.ax.imshow(display_grid, cmap=cmap, norm=norm, aspect='equal')
+        else:
+            self._im.set_data(display_grid)
+            self._im.set_cmap(cmap)
+            self._im.set_norm(norm)
+        
+        # Add cell values (rebuilt only when the example's grid changes)
+        text_color = 'white' if colors['positive'] in ['#1a202c', '#000000', '#1e40af', '#166534'] else 'black'
+        if self._text_grid_id != id(example['grid']):
+            for artist in self._text_artists:
+                artist.remove()
+            self._text_artists = []
+            self._text_grid_id = id(example['grid'])
+            for i, j in np.argwhere(grid > 0):
+                self._text_artists.append(
                     self.ax.text(j, i, str(grid[i, j]), ha='center', va='center',
-                               fontsize=16, fontweight='bold', color=text_color)
-        
-        # Add grid lines if enabled
-        if self.show_grid.get():
-            for i in range(len(grid) + 1):
-                self.ax.axhline(y=i - 0.5, color='white', linewidth=1, alpha=0.7)
-            for j in range(len(grid[0]) + 1):
-                self.ax.axvline(x=j - 0.5, color='white', linewidth=1, alpha=0.7)
+                                 fontsize=16, fontweight='bold'))
+        for artist in self._text_artists:
+            artist.set_color(text_color)
+        
+        # Add grid lines if enabled (rebuilt only when the toggle or grid shape changes)
+        grid_lines_key = (grid.shape, self.show_grid.get())
+        if self._grid_lines_key != grid_lines_key:
+            for line in self._grid_lines:
+                line.remove()
+            self._grid_lines = []
+            self._grid_lines_key = grid_lines_key
+            if self.show_grid.get():
+                for i in range(grid_height + 1):
+                    self._grid_lines.append(self.ax.axhline(y=i - 0.5, color='white', linewidth=1, alpha=0.7))
+                for j in range(grid_width + 1):
+                    self._grid_lines.append(self.ax.axvline(x=j - 0.5, color='white', linewidth=1, alpha=0.7))
         
         # Title
-        self.ax.set_title(f"{example['title']}\nN={current_n} | Count: {result['count']} | Time: {result['computation_time']:.4f}s",
+        self.ax.set_title(f"{example['title']}\nN={current_n} | Count: {result['count']} | Time: {result['computation_time']:.4f}s ({result['algorithm']})",
                           fontsize=14, fontweight='bold', pad=20, color=self.colors['text'])
         
         # Legend
-        legend_elements = [
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors['empty'], edgecolor='black', label='Empty'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors['neighborhood'], edgecolor='black', label='Neighborhood'),
-            plt.Rectangle((0, 0), 1, 1, facecolor=colors['positive'], edgecolor='white', label='Positive Cell')
-        ]
-        legend = self.ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.6, 1))
-        legend.get_frame().set_facecolor(self.colors['card'])
-        for text in legend.get_texts():
-            text.set_color(self.colors['text'])
-        
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
+        for patch, key in zip(self._legend_patches, ('empty', 'neighborhood', 'positive')):
+            patch.set_facecolor(colors[key])
         
         # Update display
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.example_info.configure(text=f"Example {self.current_example + 1} of {len(self.examples_data)}")
         self.n_var.set(str(current_n))
     
@@ -628,7 +985,7 @@ class CustomGridDialog:
         for widget in self.grid_frame.winfo_children():
             widget.destroy()
         
-        self.grid_data = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.grid_data = np.zeros((rows, cols), dtype=np.int8)
         self.grid_entries = []
         
         container = tk.Frame(self.grid_frame, bg=self.main_app.colors['card'])
@@ -646,7 +1003,6 @@ class CustomGridDialog:
                                bg=self.main_app.colors['secondary'], fg=self.main_app.colors['text'])
                 entry.pack(side='left', padx=1, pady=1)
                 entry.insert(0, '0')
-                entry.bind('<FocusOut>', lambda e, r=r, c=c: self.update_cell(r, c, e.widget.get()))
                 row_entries.append(entry)
             
             self.grid_entries.append(row_entries)
@@ -663,42 +1019,47 @@ class CustomGridDialog:
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers")
     
-    def update_cell(self, row, col, value):
-        """Update cell value"""
-        try:
-            self.grid_data[row][col] = int(value) if value else 0
-        except ValueError:
-            self.grid_entries[row][col].delete(0, tk.END)
-            self.grid_entries[row][col].insert(0, '0')
-            self.grid_data[row][col] = 0
-    
     def random_grid(self):
         """Fill grid with random values"""
-        for r in range(len(self.grid_data)):
-            for c in range(len(self.grid_data[0])):
-                value = random.choice([0, 0, 0, 1, 2, 3])  # Mostly zeros
-                self.grid_data[r][c] = value
-                self.grid_entries[r][c].delete(0, tk.END)
-                self.grid_entries[r][c].insert(0, str(value))
+        rows, cols = len(self.grid_entries), len(self.grid_entries[0])
+        values = np.random.choice(np.array([0, 0, 0, 1, 2, 3], dtype=np.int8), size=(rows, cols))  # Mostly zeros
+        self.grid_data = values
+        for row_entries, row_values in zip(self.grid_entries, values.tolist()):
+            for entry, value in zip(row_entries, row_values):
+                entry.delete(0, tk.END)
+                entry.insert(0, str(value))
     
     def clear_grid(self):
         """Clear all grid values"""
-        for r in range(len(self.grid_data)):
-            for c in range(len(self.grid_data[0])):
-                self.grid_data[r][c] = 0
-                self.grid_entries[r][c].delete(0, tk.END)
-                self.grid_entries[r][c].insert(0, '0')
+        for row_entries in self.grid_entries:
+            for entry in row_entries:
+                entry.delete(0, tk.END)
+                entry.insert(0, '0')
+    
+    def _collect_grid(self):
+        """Read every cell entry into grid_data in one pass (blank cells count as 0)"""
+        self.grid_data = np.array([[int(entry.get().strip() or 0) for entry in row_entries]
+                                   for row_entries in self.grid_entries], dtype=np.int8)
     
     def create_example(self):
         """Create new example from custom grid"""
+        try:
+            self._collect_grid()
+        except (ValueError, OverflowError):
+            messagebox.showerror("Invalid Input", "Grid cells must contain whole numbers from -128 to 127")
+            return
+        
         try:
             n_value = int(self.main_app.n_var.get())
-            result = self.main_app.calculator.calculate_manhattan_neighborhood(self.grid_data, n_value)
+            grid_copy = self.grid_data.copy()
+            result = self.main_app.calculator.compute(grid_copy, n_value)
+            # Seed the display cache so display_current_example reuses this result
+            self.main_app._result_cache[(id(grid_copy), n_value)] = result
             
             new_example = {
                 'title': f'Custom Grid {len(self.main_app.examples_data) + 1}',
-                'description': f'User-created {len(self.grid_data)}×{len(self.grid_data[0])} grid',
-                'grid': [row[:] for row in self.grid_data],
+                'description': f'User-created {self.grid_data.shape[0]}×{self.grid_data.shape[1]} grid',
+                'grid': grid_copy,
                 'n': n_value,
                 'result': result
             }
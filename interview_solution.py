@@ -9,15 +9,16 @@ Date: July 2025
 """
 
 from typing import List, Tuple
-from collections import deque
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import time
 
 def find_positive_cells(grid: List[List[int]]) -> List[Tuple[int, int]]:
     """Find all cells containing positive values"""
     positive_cells = []
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] > 0:
+    for row, row_list in enumerate(grid):
+        for col, value in enumerate(row_list):
+            if value > 0:
                 positive_cells.append((row, col))
     return positive_cells
 
@@ -38,37 +39,68 @@ def bfs_manhattan_neighborhood(grid: List[List[int]], n: int) -> int:
         return 0
 
     rows, cols = len(grid), len(grid[0])
-    visited = set()
-    queue = deque()
+    total_cells = rows * cols
+    # Flat bitmap indexed by r * cols + c, one byte per cell, 1 = reached
+    visited = bytearray(total_cells)
 
-    # Seed BFS with all positive cells
-    for r in range(rows):
-        for c in range(cols):
-            if grid[r][c] > 0:
-                visited.add((r, c))
-                queue.append(((r, c), 0))
+    # Level-synchronous BFS: the frontier holds linear cell indices and is
+    # expanded exactly n times, so no per-entry distance is needed
+    frontier = []
 
-    while queue:
-        (r, c), dist = queue.popleft()
-        if dist == n:
-            continue
+    # Seed BFS with all positive cells; max() checks a whole row in C, so rows
+    # without a positive value are skipped without a per-cell Python loop
+    for r, row_g in enumerate(grid):
+        if max(row_g) > 0:
+            base = r * cols
+            frontier += [base + c for c, value in enumerate(row_g) if value > 0]
+    for idx in frontier:
+        visited[idx] = 1
+    visited_count = len(frontier)
 
-        # dr, dc = delta row, delta column
-        # nr, nc = new row, new column
-        # r, c = current row, current column
-        for dr, dc in [(-1,0), (1,0), (0,-1), (0,1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited:
-                visited.add((nr, nc))
-                queue.append(((nr, nc), dist + 1))
+    # Any single positive cell reaches the whole grid once n spans its diagonal
+    if frontier and n >= rows + cols - 2:
+        return total_cells
 
-    return len(visited)
+    last_col = cols - 1
+    for _ in range(n):
+        next_frontier = []
+        push = next_frontier.append
+
+        # Neighbors of idx are idx -/+ cols (up/down) and idx -/+ 1 (left/right);
+        # the column is only needed to stop left/right moves wrapping to another row
+        for idx in frontier:
+            c = idx % cols
+            up, down = idx - cols, idx + cols
+            if up >= 0 and not visited[up]:
+                visited[up] = 1
+                push(up)
+            if down < total_cells and not visited[down]:
+                visited[down] = 1
+                push(down)
+            if c and not visited[idx - 1]:
+                visited[idx - 1] = 1
+                push(idx - 1)
+            if c != last_col and not visited[idx + 1]:
+                visited[idx + 1] = 1
+                push(idx + 1)
+
+        frontier = next_frontier
+        visited_count += len(frontier)
+        # Nothing new reached, or every cell already covered (e.g. N much larger than the grid)
+        if not frontier or visited_count == total_cells:
+            break
+
+    return visited_count
 
 
 def calculate_manhattan_neighborhood(grid: List[List[int]], n: int) -> int:
     """
     Calculate the number of unique cells within Manhattan distance N of any positive cell.
     
+    In row r, a positive cell (pr, pc) covers the column interval
+    [pc - (N - |r - pr|), pc + (N - |r - pr|)]. Merging those intervals row by
+    row gives the count without visiting individual cells.
+    
     Args:
         grid: 2D list representing the grid
         n: Manhattan distance threshold (N >= 0)
@@ -82,31 +114,142 @@ def calculate_manhattan_neighborhood(grid: List[List[int]], n: int) -> int:
     if n < 0:
         return 0
     
-    # Find all positive cells
-    positive_cells = find_positive_cells(grid)
+    grid_height = len(grid)
+    grid_width = len(grid[0])
     
-    if not positive_cells:
+    # Collect positive cells as parallel row/column lists (already sorted by row)
+    positive_rows, positive_cols = [], []
+    for row in range(grid_height):
+        row_g = grid[row]
+        for col in range(grid_width):
+            if row_g[col] > 0:
+                positive_rows.append(row)
+                positive_cols.append(col)
+    
+    if not positive_rows:
         return 0
     
-    # Calculate neighborhood for all positive cells
-    all_neighborhoods = set()
-    grid_height = len(grid)
-    grid_width = len(grid[0])
+    # A positive cell whose distance to the farthest corner is at most N covers the
+    # whole grid; n >= height + width - 2 is the cheap check that holds for any cell
+    if n >= grid_height + grid_width - 2 or any(
+            max(pos_row, grid_height - 1 - pos_row) + max(pos_col, grid_width - 1 - pos_col) <= n
+            for pos_row, pos_col in zip(positive_rows, positive_cols)):
+        return grid_height * grid_width
+    
+    first_row = max(0, positive_rows[0] - n)
+    last_row = min(grid_height - 1, positive_rows[-1] + n)
+    
+    total = 0
+    for row in range(first_row, last_row + 1):
+        # Column intervals from positive cells within N rows of this one
+        intervals = []
+        lo, hi = bisect_left(positive_rows, row - n), bisect_right(positive_rows, row + n)
+        for pos_row, pos_col in zip(positive_rows[lo:hi], positive_cols[lo:hi]):
+            slack = n - abs(pos_row - row)
+            intervals.append((max(0, pos_col - slack), min(grid_width - 1, pos_col + slack)))
+        
+        # Sweep the sorted intervals, counting only columns not already covered
+        intervals.sort()
+        covered_until = -1
+        for low, high in intervals:
+            if high > covered_until:
+                total += high - max(low, covered_until + 1) + 1
+                covered_until = high
+    
+    return total
+
+def chebyshev_manhattan_neighborhood(grid: List[List[int]], n: int) -> int:
+    """
+    Rotated version: under (u, v) = (r + c, r - c) each Manhattan diamond becomes an
+    axis-aligned square [u-N, u+N] x [v-N, v+N]. Sweep u across the grid, merge the
+    v-intervals of the squares crossing that column, and count the points that map
+    back to grid cells (v in the grid's range for this u and with the same parity as u).
+    
+    Args:
+        grid: 2D list representing the grid
+        n: Manhattan distance threshold (N >= 0)
+    
+    Returns:
+        Number of unique cells in the neighborhood
+    """
+    if not grid or not grid[0] or n < 0:
+        return 0
     
-    for pos_row, pos_col in positive_cells:
-        # For each positive cell, find all cells within Manhattan distance N
-        for distance in range(n + 1):
-            for row_offset in range(-distance, distance + 1):
-                remaining_distance = distance - abs(row_offset)
-                for col_offset in range(-remaining_distance, remaining_distance + 1):
-                    new_row = pos_row + row_offset
-                    new_col = pos_col + col_offset
-                    
-                    # Check bounds
-                    if 0 <= new_row < grid_height and 0 <= new_col < grid_width:
-                        all_neighborhoods.add((new_row, new_col))
-    
-    return len(all_neighborhoods)
+    rows, cols = len(grid), len(grid[0])
+    squares = sorted((r + c, r - c) for r, c in find_positive_cells(grid))
+    if not squares:
+        return 0
+    
+    square_us = [u for u, _ in squares]
+    total = 0
+    for u in range(max(0, square_us[0] - n), min(rows + cols - 2, square_us[-1] + n) + 1):
+        # v range of real cells on this diagonal (0 <= r < rows, 0 <= c < cols)
+        v_low = max(-u, u - 2 * (cols - 1))
+        v_high = min(u, 2 * (rows - 1) - u)
+        
+        intervals = sorted((max(v - n, v_low), min(v + n, v_high))
+                           for _, v in squares[bisect_left(square_us, u - n):
+                                               bisect_right(square_us, u + n)])
+        covered_until = v_low - 1
+        for low, high in intervals:
+            low = max(low, covered_until + 1)
+            if low <= high:
+                # Only v with the same parity as u map back to integer (row, col)
+                first = low if (low - u) % 2 == 0 else low + 1
+                if first <= high:
+                    total += (high - first) // 2 + 1
+                covered_until = max(covered_until, high)
+    
+    return total
+
+# Compiled diamond stamps are cached per (n, rows, cols); the cap keeps workloads
+# with changing shapes from accumulating generated functions
+@lru_cache(maxsize=32)
+def _build_stamp(n: int, rows: int, cols: int):
+    """
+    Generate and compile stamp(r, c, bitmap) for a fixed (N, rows, cols). Each diamond
+    row becomes one slice assignment with its offsets written in as integer literals,
+    so the only work left per call is clipping the columns to the grid.
+    """
+    lines = ["def stamp(r, c, bitmap, ones=b'\\x01' * %d):" % cols,
+             "    base = r * %d" % cols]
+    # Rows more than rows - 1 away can never be inside the grid
+    for dr in range(max(-n, 1 - rows), min(n, rows - 1) + 1):
+        half_width = n - abs(dr)
+        lines += ["    if %d <= r < %d:" % (-dr, rows - dr),
+                  "        lo = c - %d" % half_width,
+                  "        hi = c + %d" % (half_width + 1),
+                  "        if lo < 0: lo = 0",
+                  "        if hi > %d: hi = %d" % (cols, cols),
+                  "        offset = base + %d" % (dr * cols),
+                  "        bitmap[offset + lo:offset + hi] = ones[:hi - lo]"]
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["stamp"]
+
+def stamp_manhattan_neighborhood(grid: List[List[int]], n: int) -> int:
+    """
+    Stamp version: OR the diamond of every positive cell into a flat bytearray
+    bitmap, one slice assignment per diamond row. The stamp function is generated
+    once per (N, rows, cols) and reused by later calls with the same shape.
+    
+    Args:
+        grid: 2D list representing the grid
+        n: Manhattan distance threshold (N >= 0)
+    
+    Returns:
+        Number of unique cells in the neighborhood
+    """
+    if not grid or not grid[0] or n < 0:
+        return 0
+    
+    rows, cols = len(grid), len(grid[0])
+    stamp = _build_stamp(n, rows, cols)
+    
+    bitmap = bytearray(rows * cols)
+    for r, c in find_positive_cells(grid):
+        stamp(r, c, bitmap)
+    return bitmap.count(1)
 
 def print_grid(grid: List[List[int]], title: str = "Grid"):
     """Print a formatted grid for visualization"""
@@ -131,22 +274,25 @@ def run_test_case(test_name: str, grid: List[List[int]], n: int, expected: int =
     print(f"\nPositive cells: {positive_cells}")
     print(f"Manhattan distance N: {n}")
     
-    # Calculate result
-    # start_time = time.time()
-    result = bfs_manhattan_neighborhood(grid, n) 
-    # result = calculate_manhattan_neighborhood(grid, n)
-
-    # end_time = time.time()
-    
-    print(f"\nRESULT: {result} cells in neighborhood")
-    # print(f"Computation time: {(end_time - start_time)*1000:.3f}ms")
-    
-    # Check expected result if provided
-    if expected is not None:
-        status = "✅ PASS" if result == expected else "❌ FAIL"
-        print(f"Expected: {expected} | Got: {result} | {status}")
+    # Calculate the result with every method and check each one
+    methods = (bfs_manhattan_neighborhood, calculate_manhattan_neighborhood,
+               chebyshev_manhattan_neighborhood, stamp_manhattan_neighborhood)
+    results = []
+    for method in methods:
+        # start_time = time.perf_counter()
+        result = method(grid, n)
+        # end_time = time.perf_counter()
+        results.append(result)
+        
+        print(f"\n{method.__name__}: {result} cells in neighborhood")
+        # print(f"Computation time: {(end_time - start_time)*1000:.3f}ms")
+        
+        # Check expected result if provided
+        if expected is not None:
+            status = "✅ PASS" if result == expected else "❌ FAIL"
+            print(f"Expected: {expected} | Got: {result} | {status}")
     
-    return result
+    return results[0]
 
 def main():
     """Main function demonstrating the algorithm with test cases"""